@@ -50,8 +50,7 @@ class Caption:
             json_captions_url = self.url.replace('fmt=srv3', 'fmt=json3')
         else:
             json_captions_url = f'{self.url}&fmt=json3'
-        text = request.get(json_captions_url)
-        parsed = json.loads(text)
+        parsed = json.loads(request._get_bytes(json_captions_url))
         assert parsed['wireMagic'] == 'pb3', 'Unexpected captions format'
         return parsed
 
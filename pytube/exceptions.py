@@ -1,9 +1,35 @@
 """Library specific exception definitions."""
 from typing import Pattern, Union
+import copyreg
 import logging
 
 logger = logging.getLogger(__name__)
 
+
+class _slot_cached_property:
+    """:func:`functools.cached_property` for classes using ``__slots__``.
+
+    The value is cached in the ``_<name>`` slot, which the class must declare,
+    rather than in the instance ``__dict__``.
+    """
+    def __init__(self, func):
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name):
+        self.slot_name = f'_{name}'
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            return getattr(instance, self.slot_name)
+        except AttributeError:
+            value = self.func(instance)
+            setattr(instance, self.slot_name, value)
+            return value
+
+
 class PytubeError(Exception):
     """Base pytube exception that all others inherit.
 
@@ -11,22 +37,39 @@ class PytubeError(Exception):
     in unintended errors being unexpectedly and incorrectly handled within
     implementers code.
     """
+    __slots__ = ()
+
+    def __reduce__(self):
+        # Slots aren't pickled, and rebuilding from the constructor arguments
+        #  would run __init__ and its side effects again
+        state = {
+            slot: getattr(self, slot)
+            for cls in type(self).__mro__
+            for slot in getattr(cls, '__slots__', ())
+            if hasattr(self, slot)
+        }
+        state.update(self.__dict__)
+        return copyreg.__newobj__, (self.__class__, *self.args), state
 
 
 class MaxRetriesExceeded(PytubeError):
     """Maximum number of retries exceeded."""
+    __slots__ = ()
 
 
 class HTMLParseError(PytubeError):
     """HTML could not be parsed"""
+    __slots__ = ()
 
 
 class ExtractError(PytubeError):
     """Data extraction based exception."""
+    __slots__ = ()
 
 
 class RegexMatchError(ExtractError):
     """Regex pattern did not return any matches."""
+    __slots__ = ('caller', 'pattern')
 
     def __init__(self, caller: str, pattern: Union[str, Pattern]):
         """
@@ -42,6 +85,8 @@ class RegexMatchError(ExtractError):
 
 class VideoUnavailable(PytubeError):
     """Base video unavailable error."""
+    __slots__ = ('video_id', '_error_string')
+
     def __init__(self, video_id: str):
         """
         :param str video_id:
@@ -50,85 +95,57 @@ class VideoUnavailable(PytubeError):
         self.video_id = video_id
         super().__init__(self.error_string)
 
-    @property
+    @_slot_cached_property
     def error_string(self):
         return f'{self.video_id} is unavailable'
 
 
 class AgeRestrictedError(VideoUnavailable):
     """Video is age restricted, and cannot be accessed without OAuth."""
-    def __init__(self, video_id: str):
-        """
-        :param str video_id:
-            A YouTube video identifier.
-        """
-        self.video_id = video_id
-        super().__init__(self.video_id)
+    __slots__ = ()
 
-    @property
+    @_slot_cached_property
     def error_string(self):
         return f"{self.video_id} is age restricted, and can't be accessed without logging in."
 
 
 class LiveStreamError(VideoUnavailable):
     """Video is a live stream."""
-    def __init__(self, video_id: str):
-        """
-        :param str video_id:
-            A YouTube video identifier.
-        """
-        self.video_id = video_id
-        super().__init__(self.video_id)
+    __slots__ = ()
 
-    @property
+    @_slot_cached_property
     def error_string(self):
         return f'{self.video_id} is streaming live and cannot be loaded'
 
 
 class VideoPrivate(VideoUnavailable):
-    def __init__(self, video_id: str):
-        """
-        :param str video_id:
-            A YouTube video identifier.
-        """
-        self.video_id = video_id
-        super().__init__(self.video_id)
+    __slots__ = ()
 
-    @property
+    @_slot_cached_property
     def error_string(self):
         return f'{self.video_id} is a private video'
 
 
 class RecordingUnavailable(VideoUnavailable):
-    def __init__(self, video_id: str):
-        """
-        :param str video_id:
-            A YouTube video identifier.
-        """
-        self.video_id = video_id
-        super().__init__(self.video_id)
+    __slots__ = ()
 
-    @property
+    @_slot_cached_property
     def error_string(self):
         return f'{self.video_id} does not have a live stream recording available'
 
 
 class BotDetection(VideoUnavailable):
-    def __init__(self, video_id: str):
-        """
-        :param str video_id:
-            A YouTube video identifier.
-        """
-        self.video_id = video_id
-        super().__init__(self.video_id)
+    __slots__ = ()
 
-    @property
+    @_slot_cached_property
     def error_string(self):
         return (f'{self.video_id} This request was detected as a bot. Use `use_po_token=True` to view. '
                 f'See more details at https://github.com/JuanBindez/pytubefix/pull/209')
 
 
 class PoTokenRequired(VideoUnavailable):
+    __slots__ = ('client_name',)
+
     def __init__(self, video_id: str, client_name: str):
         """
         :param str video_id:
@@ -136,27 +153,27 @@ class PoTokenRequired(VideoUnavailable):
         :param str client_name:
             A YouTube client identifier.
         """
-        self.video_id = video_id
         self.client_name = client_name
-        super().__init__(self.video_id)
+        super().__init__(video_id)
 
-    @property
+    @_slot_cached_property
     def error_string(self):
         return (f'{self.video_id} The {self.client_name} client requires PoToken to obtain functional streams, '
                 f'See more details at https://github.com/JuanBindez/pytubefix/pull/209')
 
 
 class LoginRequired(VideoUnavailable):
+    __slots__ = ('reason',)
+
     def __init__(self, video_id: str, reason: str):
         """
         :param str video_id:
             A YouTube video identifier.
         """
-        self.video_id = video_id
         self.reason = reason
-        super().__init__(self.video_id)
+        super().__init__(video_id)
 
-    @property
+    @_slot_cached_property
     def error_string(self):
         return f'{self.video_id} requires login to view, YouTube reason: {self.reason}'
 
@@ -168,57 +185,33 @@ class MembersOnly(VideoUnavailable):
     subscribed to a content creator.
     ref: https://support.google.com/youtube/answer/7544492?hl=en
     """
-    def __init__(self, video_id: str):
-        """
-        :param str video_id:
-            A YouTube video identifier.
-        """
-        self.video_id = video_id
-        super().__init__(self.video_id)
+    __slots__ = ()
 
-    @property
+    @_slot_cached_property
     def error_string(self):
         return f'{self.video_id} is a members-only video'
 
 
 class VideoRegionBlocked(VideoUnavailable):
-    def __init__(self, video_id: str):
-        """
-        :param str video_id:
-            A YouTube video identifier.
-        """
-        self.video_id = video_id
-        super().__init__(self.video_id)
+    __slots__ = ()
 
-    @property
+    @_slot_cached_property
     def error_string(self):
         return f'{self.video_id} is not available in your region'
 
 
 class AgeCheckRequiredError(VideoUnavailable):
-    def __init__(self, video_id: str):
-        """
-        :param str video_id:
-            A YouTube video identifier.
-        """
-        self.video_id = video_id
-        super().__init__(self.video_id)
+    __slots__ = ()
 
-    @property
+    @_slot_cached_property
     def error_string(self):
         return f"{self.video_id} has age restrictions and cannot be accessed without confirmation."
 
 
 class AgeCheckRequiredAccountError(VideoUnavailable):
-    def __init__(self, video_id: str):
-        """
-        :param str video_id:
-            A YouTube video identifier.
-        """
-        self.video_id = video_id
-        super().__init__(self.video_id)
+    __slots__ = ()
 
-    @property
+    @_slot_cached_property
     def error_string(self):
         return (f"{self.video_id} may be inappropriate for "
                 f"some users. Sign in to your primary account to confirm your age.")
@@ -227,6 +220,7 @@ class AgeCheckRequiredAccountError(VideoUnavailable):
 
 class UnknownVideoError(VideoUnavailable):
     """Unknown video error."""
+    __slots__ = ('status', 'reason', 'developer_message')
 
     def __init__(self, video_id: str, status: str = None, reason: str = None, developer_message: str = None):
         """
@@ -239,24 +233,26 @@ class UnknownVideoError(VideoUnavailable):
         :param str developer_message:
             The message from the developer.
         """
-        self.video_id = video_id
         self.status = status
         self.reason = reason
         self.developer_message = developer_message
 
-        logger.warning('Unknown Video Error')
-        logger.warning(f'Video ID: {self.video_id}')
-        logger.warning(f'Status: {self.status}')
-        logger.warning(f'Reason: {self.reason}')
-        logger.warning(f'Developer Message: {self.developer_message}')
+        # Logged as a single record, so concurrent downloads can't interleave
+        #  their lines and the logging lock is only taken once
         logger.warning(
+            'Unknown Video Error\n'
+            'Video ID: %s\n'
+            'Status: %s\n'
+            'Reason: %s\n'
+            'Developer Message: %s\n'
             'Please open an issue at '
             'https://github.com/JuanBindez/pytubefix/issues '
-            'and provide the above log output.'
+            'and provide the above log output.',
+            video_id, self.status, self.reason, self.developer_message
         )
 
-        super().__init__(self.video_id)
+        super().__init__(video_id)
 
-    @property
+    @_slot_cached_property
     def error_string(self):
         return f'{self.video_id} has an unknown error, check logs for more info'
@@ -180,6 +180,11 @@ def safe_filename(s: str, max_length: int = 255) -> str:
 def setup_logger(level: int = logging.ERROR, log_filename: Optional[str] = None) -> None:
     """Create a configured instance of logger.
 
+    The handlers added here write synchronously from whichever thread logs.
+    Applications downloading from many threads can instead attach a
+    :class:`logging.handlers.QueueHandler` to the "pytube" logger and drain
+    it with a :class:`logging.handlers.QueueListener`.
+
     :param int level:
         Describe the severity level of the logs to handle.
     """
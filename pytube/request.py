@@ -1,54 +1,134 @@
-"""Implements a simple wrapper around urlopen."""
+"""Implements a simple wrapper around pooled keep-alive http connections."""
+import base64
 import http.client
+import io
 import json
 import logging
 import re
 import socket
 import ssl
 import random
-import threading # to get thread ids
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from urllib import parse
 from urllib.error import URLError, HTTPError
-from urllib.request import Request, urlopen
+from urllib.request import Request, getproxies, proxy_bypass
 
 from pytube.exceptions import RegexMatchError, MaxRetriesExceeded
-from pytube.helpers import regex_search, make_fronted_url, split_redirector_url
+from pytube.helpers import make_fronted_url, split_redirector_url
 
 logger = logging.getLogger(__name__)
 default_range_size = 9437184  # 9MB
+read_chunk_size = 262144  # 256KB
 
-last_url = {} # used to store the last url per thread for poisoning 'socket.getaddrinfo'
+# used to store the last url per thread for poisoning 'socket.getaddrinfo'
+_last_url = threading.local()
 unverified_context = ssl._create_unverified_context()
 _dns_resolver = ("google-public-dns-a.google.com", "216.239.36.36") # Traditional IP addresses (8.8.8.8 & 8.8.8.4) can be blocked
 _orig_getaddrinfo = socket.getaddrinfo
+_redirect_codes = (301, 302, 303, 307, 308)
+_retry_status_codes = (408, 429, 500, 502, 503, 504)
+_retry_methods = ("GET", "HEAD")
+_retry_backoff_factor = 0.3
+_segment_count_pattern = re.compile(rb'Segment-Count:\s*(\d+)')
+_segment_count_overlap = 256
+_segment_header_range_size = 8192
+_seq_filesize_workers = 16
+
+# domain name -> (ip, expiry time), least recently used first
+_dns_cache = OrderedDict()
+_dns_cache_lock = threading.Lock()
+_dns_cache_ttl = 300
+_dns_cache_maxsize = 128
+
+# Idle keep-alive connections of each thread, keyed by (scheme, netloc, Host
+# header, proxy). The Host header is part of the key because fronted requests
+# all go to the same netloc, but 'socket.getaddrinfo' resolves it differently
+# per real host. Only new connections go through DNS, reused ones skip it along
+# with the TLS handshake.
+_thread_connections = threading.local()
+
+# Shared by all the seq_filesize calls, so its threads and their keep-alive
+# connections outlive a single call
+_seq_filesize_executor = ThreadPoolExecutor(
+    max_workers=_seq_filesize_workers,
+    thread_name_prefix="pytube_seq_filesize"
+)
+
+
+class _PooledResponse(http.client.HTTPResponse):
+    """Response which hands its connection back to the pool once it is done.
+
+    A connection is only reusable when the body was read to the end, a
+    response closed early leaves unread data on the socket. Releasing also
+    drops the reference to the connection, which refers back to its last
+    response.
+    """
+    _release = None
+
+    def _close_conn(self):
+        super()._close_conn()
+        self._release_connection(reusable=True)
+
+    def close(self):
+        if self.fp is not None:
+            # Body was not read to the end
+            self._release_connection(reusable=False)
+        super().close()
+
+    def _release_connection(self, reusable):
+        release, self._release = self._release, None
+        if release is not None:
+            release(reusable)
 
 
 def _read_ip_from_dns_answer(json_data):
-    ip = json_data["Question"][0]["name"]
-    search = True
+    # Follow the CNAME chain from the question to its A record, taking the
+    #  first answer for names with several of them
+    answers = {}
+    for answer in json_data["Answer"]:
+        answers.setdefault(answer["name"], answer["data"])
 
-    while search:
-        search = False
-        for answer in json_data["Answer"]:
-            if ip == answer["name"]:
-                ip = answer["data"]
-                search = True
+    ip = json_data["Question"][0]["name"]
+    for _ in range(len(answers)):
+        if ip not in answers:
+            break
+        ip = answers[ip]
 
     return ip
 
 
-@lru_cache
 def get_dns_ip(domain_name):
     """Resolve a DNS Name using DNS-over-HTTP with Domain Fronting
 
+    Results are cached for a few minutes, as DNS records expire.
+
     :param str domain_name:
         Domain Name to resolve
     :rtype: str
     :returns:
         IP Address of associated DNS Name
     """
+    now = time.monotonic()
+    with _dns_cache_lock:
+        cached = _dns_cache.get(domain_name)
+        if cached is not None and cached[1] > now:
+            _dns_cache.move_to_end(domain_name)
+            return cached[0]
+
+    ip = _resolve_dns_ip(domain_name)
+    with _dns_cache_lock:
+        _dns_cache[domain_name] = (ip, now + _dns_cache_ttl)
+        _dns_cache.move_to_end(domain_name)
+        while len(_dns_cache) > _dns_cache_maxsize:
+            _dns_cache.popitem(last=False)
+    return ip
+
 
+def _resolve_dns_ip(domain_name):
     url = "https://www.google.com/resolve?name={}".format(domain_name)
     request = Request(
         url,
@@ -58,42 +138,201 @@ def get_dns_ip(domain_name):
             "Host" : _dns_resolver[0]
         }
     )
-    last_url[threading.get_ident()] = url
-    res = urlopen(request, context = unverified_context)
-    return _read_ip_from_dns_answer(json.loads(res.read().decode("utf-8")))
+    # This usually runs from within the patched 'socket.getaddrinfo' of
+    #  another request, which may still need its own url afterwards
+    previous_url = getattr(_last_url, "url", None)
+    _last_url.url = url
+    try:
+        res = _urlopen(request)
+        return _read_ip_from_dns_answer(json.loads(res.read()))
+    finally:
+        _last_url.url = previous_url
 
 
 def _patched_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
-    res = _orig_getaddrinfo(host, port, family, type, proto, flags)
-    url = last_url.get(threading.get_ident(), None)
+    url = getattr(_last_url, "url", None)
 
-    if not url:
-        return res
+    if url:
+        if "/resolve" in url:
+            addr = _dns_resolver[1]
+        elif "googlevideo.com" in url:
+            addr = get_dns_ip(split_redirector_url(url)[0])
+        else:
+            addr = None
 
-    if "/resolve" in url:
-        res = [list(res[0])]
-        addr = _dns_resolver[1]
-        res[0][4] = (addr, 443)
-    elif "googlevideo.com" in url:
-        res = [list(res[0])]
-        addr = get_dns_ip(split_redirector_url(url)[0])
-        res[0][4] = (addr, 443)
+        # We already know the address, so there is no need for a real lookup
+        if addr is not None:
+            return [(socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP, '', (addr, 443))]
 
-    return res
+    return _orig_getaddrinfo(host, port, family, type, proto, flags)
 
 socket.getaddrinfo = _patched_getaddrinfo
 
 
+def _idle_connections():
+    try:
+        return _thread_connections.idle
+    except AttributeError:
+        _thread_connections.idle = {}
+        return _thread_connections.idle
+
+
+def _get_proxy(scheme, netloc):
+    """Find the proxy to use from the environment, like urlopen does.
+
+    :rtype: urllib.parse.SplitResult
+    :returns:
+        The proxy url, or None to connect directly.
+    """
+    proxy = getproxies().get(scheme)
+    if not proxy or proxy_bypass(netloc):
+        return None
+    if "://" not in proxy:
+        proxy = "http://" + proxy
+    return parse.urlsplit(proxy)
+
+
+def _proxy_headers(proxy):
+    if proxy.username is None:
+        return {}
+    credentials = f"{parse.unquote(proxy.username)}:{parse.unquote(proxy.password or '')}"
+    return {"Proxy-Authorization": "Basic " + base64.b64encode(credentials.encode()).decode()}
+
+
+def _acquire_connection(key):
+    conn = _idle_connections().pop(key, None)
+    if conn is not None:
+        return conn, True
+
+    scheme, netloc, _, proxy = key
+    if proxy is None:
+        host, port = netloc, None
+    else:
+        host, port = proxy.hostname, proxy.port
+
+    if scheme == "https":
+        conn = http.client.HTTPSConnection(host, port, context=unverified_context)
+        if proxy is not None:
+            conn.set_tunnel(netloc, headers=_proxy_headers(proxy))
+    else:
+        conn = http.client.HTTPConnection(host, port)
+    conn.response_class = _PooledResponse
+    return conn, False
+
+
+def _release_connection(key, conn, reusable):
+    if not reusable:
+        conn.close()
+        return
+
+    idle = _idle_connections()
+    if key in idle:
+        conn.close()
+    else:
+        idle[key] = conn
+
+
+def _urlopen(request, timeout=socket._GLOBAL_DEFAULT_TIMEOUT):
+    """Send a request over a keep-alive connection of the current thread.
+
+    Mirrors the behaviour of :func:`urllib.request.urlopen` that the rest of
+    pytube relies on: proxies are taken from the environment, socket errors
+    are raised as :class:`URLError` and error statuses as :class:`HTTPError`.
+    Redirects are not followed.
+
+    :param Request request:
+        The request to send.
+    :rtype: http.client.HTTPResponse
+    """
+    split_url = parse.urlsplit(request.full_url)
+    proxy = _get_proxy(split_url.scheme, split_url.netloc)
+    key = (split_url.scheme, split_url.netloc, request.get_header("Host"), proxy)
+    headers = dict(request.header_items())
+    if proxy is not None and split_url.scheme == "http":
+        # Plain http goes through the proxy with the absolute url
+        path = request.full_url
+        headers.update(_proxy_headers(proxy))
+    else:
+        path = split_url.path or "/"
+        if split_url.query:
+            path += "?" + split_url.query
+    if timeout is socket._GLOBAL_DEFAULT_TIMEOUT:
+        timeout = socket.getdefaulttimeout()
+
+    # The proxy resolves the target itself, its own address must not be
+    #  poisoned by the patched 'socket.getaddrinfo'
+    last_url = getattr(_last_url, "url", None)
+    if proxy is not None:
+        _last_url.url = None
+
+    try:
+        while True:
+            conn, reused = _acquire_connection(key)
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            try:
+                conn.request(request.get_method(), path, body=request.data, headers=headers)
+                response = conn.getresponse()
+            except Exception as err:
+                conn.close()
+                # The server may drop an idle keep-alive connection at any time,
+                # try again on a fresh one
+                if reused and isinstance(err, (http.client.BadStatusLine, ConnectionError)):
+                    continue
+                if isinstance(err, OSError):
+                    raise URLError(err) from err
+                raise
+            break
+    finally:
+        _last_url.url = last_url
+
+    if response.length == 0:
+        # Nothing to read (HEAD, 204, 304...), callers may never touch the body
+        response.read()
+    if response.isclosed():
+        _release_connection(key, conn, reusable=True)
+    else:
+        response._release = lambda reusable: _release_connection(key, conn, reusable)
+
+    if response.status >= 400:
+        # Read the error body so the connection goes back to the pool
+        raise HTTPError(
+            request.full_url,
+            response.status,
+            response.reason,
+            response.headers,
+            io.BytesIO(response.read())
+        )
+    return response
+
+
+# Fronting only depends on the scheme, host and path of googlevideo urls, which
+# stay the same across all the range and sequence requests of a download
+_cached_fronted_url = lru_cache(maxsize=1024)(make_fronted_url)
+
+
+def _make_fronted_url(url):
+    base_url, sep, query = url.partition("?")
+    if "googlevideo.com" not in base_url:
+        return make_fronted_url(url)
+    front_url, host = _cached_fronted_url(base_url)
+    return front_url + sep + query, host
+
+
 def _execute_request(
     url,
     method=None,
     headers=None,
     data=None,
     timeout=socket._GLOBAL_DEFAULT_TIMEOUT,
-    retries=3
+    retries=3,
+    max_redirects=10
 ):
-    last_url[threading.get_ident()] = url
-    front_url, host = make_fronted_url(url)
+    # Only these urls are resolved differently by 'socket.getaddrinfo', clear
+    # it for anything else so its lookups take the unpatched path straight away
+    patched_url = url if "/resolve" in url or "googlevideo.com" in url else None
+    front_url, host = _make_fronted_url(url)
     base_headers = {"User-Agent": "Mozilla/5.0", "accept-language": "en-US,en"}
     if host is not None:
         base_headers["Host"] = host
@@ -104,24 +343,57 @@ def _execute_request(
         if not isinstance(data, bytes):
             data = bytes(json.dumps(data), encoding="utf-8")
     if front_url.lower().startswith("http"):
-        logger.debug(f"Requesting {'GET' if method is None else method}: {front_url}{'' if host is None else ' (Host: {})'.format(host)}")
-        logger.debug(f"Retry count set to: {retries}")
-
-        # We need retries because domain fronting is considered as unreliable connection
-        # which means the connection can be interrupted by server in the beginning
-        while retries:
-            try:
-                request = Request(front_url, headers=base_headers, method=method, data=data)
-                break
-            except urllib.error.URLError as ex:
-                retries -= 1
-                if retries == 0:
-                    raise ex
-                print(str(ex) + f", retrying ({retries})")
+        logger.debug("Requesting %s: %s (Host: %s)", method or "GET", front_url, host)
+        logger.debug("Retry count set to: %s", retries)
+        request = Request(front_url, headers=base_headers, method=method, data=data)
     else:
         raise ValueError("Invalid URL")
 
-    res = urlopen(request, timeout=timeout, context = unverified_context)  # nosec
+    # We need retries because domain fronting is considered as unreliable connection
+    # which means the connection can be interrupted by server in the beginning
+    tries = 0
+    while True:
+        # Set on every attempt, a retry may need to open a new connection
+        _last_url.url = patched_url
+        try:
+            res = _urlopen(request, timeout=timeout)  # nosec
+            break
+        except URLError as err:
+            retryable = not isinstance(err, HTTPError) or err.code in _retry_status_codes
+            if not retryable or request.get_method() not in _retry_methods or tries >= retries:
+                raise
+            if isinstance(err, HTTPError):
+                err.close()
+            delay = _retry_backoff_factor * (2 ** tries)
+            tries += 1
+            logger.debug("%s, retrying in %ss (%s/%s)", err, delay, tries, retries)
+            time.sleep(delay)
+
+    location = res.headers.get("Location") if res.status in _redirect_codes else None
+    if location and max_redirects <= 0:
+        raise HTTPError(
+            request.full_url,
+            res.status,
+            "Too many redirects, the last one was: " + res.reason,
+            res.headers,
+            res
+        )
+    if location:
+        # The new location has to be fronted as well, so redirects are
+        # followed here rather than by the connection
+        location = parse.urljoin(url, location)
+        res.read()
+        if res.status == 303 or (res.status in (301, 302) and method == "POST"):
+            method, data = "GET", None
+        return _execute_request(
+            location,
+            method=method,
+            headers=headers,
+            data=data,
+            timeout=timeout,
+            retries=retries,
+            max_redirects=max_redirects - 1
+        )
     return res
 
 
@@ -136,10 +408,26 @@ def get(url, extra_headers=None, timeout=socket._GLOBAL_DEFAULT_TIMEOUT):
     :returns:
         UTF-8 encoded string of response
     """
+    return _get_bytes(url, extra_headers=extra_headers, timeout=timeout).decode("utf-8")
+
+
+def _get_bytes(url, extra_headers=None, timeout=socket._GLOBAL_DEFAULT_TIMEOUT):
+    """Send an http GET request without decoding the response.
+
+    Useful for json responses, which :func:`json.loads` parses from bytes.
+
+    :param str url:
+        The URL to perform the GET request for.
+    :param dict extra_headers:
+        Extra headers to add to the request
+    :rtype: bytes
+    :returns:
+        Raw body of response
+    """
     if extra_headers is None:
         extra_headers = {}
     response = _execute_request(url, headers=extra_headers, timeout=timeout)
-    return response.read().decode("utf-8")
+    return response.read()
 
 
 def post(url, extra_headers=None, data=None, timeout=socket._GLOBAL_DEFAULT_TIMEOUT):
@@ -173,6 +461,21 @@ def post(url, extra_headers=None, data=None, timeout=socket._GLOBAL_DEFAULT_TIME
     return response.read().decode("utf-8")
 
 
+def _seq_url_prefix(url):
+    """Build the url for sequential requests, up to the sequence number.
+
+    Only the sequence number changes between requests, so the rest of the
+    query is encoded once and the number can simply be appended.
+    """
+    split_url = parse.urlsplit(url)
+    base_url = '%s://%s/%s?' % (split_url.scheme, split_url.netloc, split_url.path)
+    querys = dict(parse.parse_qsl(split_url.query))
+    querys.pop('sq', None)
+    if querys:
+        base_url += parse.urlencode(querys) + '&'
+    return base_url + 'sq='
+
+
 def seq_stream(
     url,
     timeout=socket._GLOBAL_DEFAULT_TIMEOUT,
@@ -183,35 +486,38 @@ def seq_stream(
     :rtype: Iterable[bytes]
     """
     # YouTube expects a request sequence number as part of the parameters.
-    split_url = parse.urlsplit(url)
-    base_url = '%s://%s/%s?' % (split_url.scheme, split_url.netloc, split_url.path)
-
-    querys = dict(parse.parse_qsl(split_url.query))
+    seq_url = _seq_url_prefix(url)
 
     # The 0th sequential request provides the file headers, which tell us
     #  information about how the file is segmented.
-    querys['sq'] = 0
-    url = base_url + parse.urlencode(querys)
+    url = f"{seq_url}0"
 
-    segment_data = b''
+    # We parse the header for the number of segments as it streams by, only
+    #  keeping the end of the previous chunk in case the match is split
+    segment_count = None
+    tail = b''
     for chunk in stream(url, timeout=timeout, max_retries=max_retries):
         yield chunk
-        segment_data += chunk
+        if segment_count is None:
+            data = tail + chunk
+            match = _segment_count_pattern.search(data)
+            # Digits at the very end of the data may continue in the next chunk
+            if match and match.end() < len(data):
+                segment_count = int(match.group(1))
+            else:
+                tail = data[-_segment_count_overlap:]
 
-    # We can then parse the header to find the number of segments
-    stream_info = segment_data.split(b'\r\n')
-    segment_count_pattern = re.compile(b'Segment-Count: (\\d+)')
-    for line in stream_info:
-        match = segment_count_pattern.search(line)
-        if match:
-            segment_count = int(match.group(1).decode('utf-8'))
+    if segment_count is None:
+        match = _segment_count_pattern.search(tail)
+        if not match:
+            raise RegexMatchError('seq_stream', _segment_count_pattern.pattern)
+        segment_count = int(match.group(1))
 
     # We request these segments sequentially to build the file.
     seq_num = 1
     while seq_num <= segment_count:
         # Create sequential request URL
-        querys['sq'] = seq_num
-        url = base_url + parse.urlencode(querys)
+        url = f"{seq_url}{seq_num}"
 
         yield from stream(url, timeout=timeout, max_retries=max_retries)
         seq_num += 1
@@ -228,57 +534,61 @@ def stream(
     :param str url: The URL to perform the GET request for.
     :rtype: Iterable[bytes]
     """
-    file_size: int = default_range_size  # fake filesize to start
-    downloaded = 0
-    while downloaded < file_size:
+    file_size = None  # unknown until the first response
+    downloaded = start_byte_pos
+    while file_size is None or downloaded < file_size:
         # stop_pos = min(downloaded + default_range_size, file_size) - 1
-        tries = 0
-
-        # Attempt to make the request multiple times as necessary.
-        while True:
-            # If the max retries is exceeded, raise an exception
-            if tries >= 1 + max_retries:
-                raise MaxRetriesExceeded()
-
-            # Try to execute the request, ignoring socket timeouts
-            try:
-                response = _execute_request(
-                    url + ("" if start_byte_pos == 0 else f"&range={start_byte_pos}-99999999999"),
-                    method="GET",
-                    timeout=timeout
-                )
-            except URLError as e:
-                # We only want to skip over timeout errors, and
-                # raise any other URLError exceptions
-                if isinstance(e.reason, socket.timeout):
-                    pass
-                else:
-                    raise
-            except http.client.IncompleteRead:
-                # Allow retries on IncompleteRead errors for unreliable connections
-                pass
-            else:
-                # On a successful request, break from loop
-                break
-            tries += 1
+        # Continue from the last byte we got, in case the previous response
+        #  was cut short
+        if file_size is not None:
+            ranged_url = f"{url}&range={downloaded}-{file_size - 1}"
+        elif downloaded:
+            ranged_url = f"{url}&range={downloaded}-99999999999"
+        else:
+            ranged_url = url
 
-        if file_size == default_range_size:
+        try:
+            response = _execute_request(
+                ranged_url,
+                method="GET",
+                timeout=timeout,
+                retries=max_retries
+            )
+        except URLError as e:
+            # Timeouts are retried by _execute_request, any other URLError
+            # exception is raised as is
+            if isinstance(e, HTTPError) or not isinstance(e.reason, socket.timeout):
+                raise
+            raise MaxRetriesExceeded() from e
+
+        if file_size is None:
             try:
-                content_range = response.info()["Content-Length"]
-                file_size = int(content_range)
-                downloaded = start_byte_pos
-            except (KeyError, IndexError, ValueError) as e:
+                file_size = downloaded + int(response.info()["Content-Length"])
+            except (KeyError, TypeError, ValueError) as e:
                 logger.error(e)
-        while True:
-            chunk = response.read(32768) # 32KB
-            if not chunk:
-                break
-            downloaded += len(chunk)
-            yield chunk
+
+        response_start = downloaded
+        try:
+            while True:
+                chunk = response.read(read_chunk_size)
+                if not chunk:
+                    break
+                downloaded += len(chunk)
+                yield chunk
+        finally:
+            # Hands the connection back even if the generator is abandoned
+            response.close()
+
+        if file_size is None:
+            # Without a size we can't tell a short response from a complete one
+            break
+        if downloaded == response_start and downloaded < file_size:
+            # The response was empty, asking again won't get us any further
+            raise MaxRetriesExceeded()
     return  # pylint: disable=R1711
 
 
-@lru_cache()
+@lru_cache(maxsize=256)
 def filesize(url):
     """Fetch size in bytes of file at given URL
 
@@ -288,7 +598,7 @@ def filesize(url):
     return int(head(url)["content-length"])
 
 
-@lru_cache()
+@lru_cache(maxsize=256)
 def seq_filesize(url):
     """Fetch size in bytes of file at given URL from sequential requests
 
@@ -297,49 +607,50 @@ def seq_filesize(url):
     """
     total_filesize = 0
     # YouTube expects a request sequence number as part of the parameters.
-    split_url = parse.urlsplit(url)
-    base_url = '%s://%s/%s?' % (split_url.scheme, split_url.netloc, split_url.path)
-    querys = dict(parse.parse_qsl(split_url.query))
+    seq_url = _seq_url_prefix(url)
 
     # The 0th sequential request provides the file headers, which tell us
     #  information about how the file is segmented.
-    querys['sq'] = 0
-    url = base_url + parse.urlencode(querys)
+    url = f"{seq_url}0"
+
+    # The segment count is near the start of the file header, so we only
+    #  request its beginning and fall back to the whole of it if that's not enough
     response = _execute_request(
-        url, method="GET"
+        url,
+        method="GET",
+        headers={"Range": f"bytes=0-{_segment_header_range_size - 1}"}
     )
-
     response_value = response.read()
-    # The file header must be added to the total filesize
-    total_filesize += len(response_value)
+    match = _segment_count_pattern.search(response_value)
+    content_range = response.headers.get("Content-Range")
+    # The total is '*' when the server doesn't know the size of the header
+    header_size = content_range.rpartition("/")[2] if content_range else ""
+    if match and header_size.isdigit():
+        # The file header must be added to the total filesize
+        total_filesize += int(header_size)
+    else:
+        # Unless the range was ignored we only have part of the header
+        if not match or content_range:
+            response_value = _execute_request(url, method="GET").read()
+            match = _segment_count_pattern.search(response_value)
+        total_filesize += len(response_value)
 
     # We can then parse the header to find the number of segments
-    segment_count = 0
-    stream_info = response_value.split(b'\r\n')
-    segment_regex = b'Segment-Count: (\\d+)'
-    for line in stream_info:
-        # One of the lines should contain the segment count, but we don't know
-        #  which, so we need to iterate through the lines to find it
-        try:
-            segment_count = int(regex_search(segment_regex, line, 1))
-        except RegexMatchError:
-            pass
-
-    if segment_count == 0:
-        raise RegexMatchError('seq_filesize', segment_regex)
+    if not match:
+        raise RegexMatchError('seq_filesize', _segment_count_pattern.pattern)
+    segment_count = int(match.group(1))
 
-    # We make HEAD requests to the segments sequentially to find the total filesize.
-    seq_num = 1
-    while seq_num <= segment_count:
-        # Create sequential request URL
-        querys['sq'] = seq_num
-        url = base_url + parse.urlencode(querys)
+    # We make HEAD requests to the segments concurrently to find the total filesize.
+    segment_urls = [f"{seq_url}{seq_num}" for seq_num in range(1, segment_count + 1)]
 
-        total_filesize += int(head(url)['content-length'])
-        seq_num += 1
+    total_filesize += sum(_seq_filesize_executor.map(_segment_filesize, segment_urls))
     return total_filesize
 
 
+def _segment_filesize(url):
+    return int(head(url)['content-length'])
+
+
 def head(url):
     """Fetch headers returned http GET request.
 
@@ -167,3 +167,17 @@ def test_generate_srt_captions(request):
         "00:00:08,300 --> 00:00:11,000\n"
         "如要啓動字幕，請按一下這裡的圖示。"
     )
+
+
+@mock.patch("pytube.request._get_bytes")
+def test_json_captions(request_get_bytes):
+    request_get_bytes.return_value = b'{"wireMagic": "pb3", "events": []}'
+    caption = Caption(
+        {
+            "baseUrl": "url1",
+            "name": {"simpleText": "name1"},
+            "languageCode": "en",
+            "vssId": ".en",
+        }
+    )
+    assert caption.json_captions == {"wireMagic": "pb3", "events": []}
@@ -1,3 +1,5 @@
+import logging
+import pickle
 import pytest
 from unittest import mock
 
@@ -65,7 +67,7 @@ def test_region_locked_error():
 
 
 def test_raises_video_private(private):
-    with mock.patch('pytube.request.urlopen') as mock_url_open:
+    with mock.patch('pytube.request._urlopen') as mock_url_open:
         # Mock the responses to YouTube
         mock_url_open_object = mock.Mock()
         mock_url_open_object.read.side_effect = [
@@ -77,7 +79,7 @@ def test_raises_video_private(private):
 
 
 def test_raises_recording_unavailable(missing_recording):
-    with mock.patch('pytube.request.urlopen') as mock_url_open:
+    with mock.patch('pytube.request._urlopen') as mock_url_open:
         # Mock the responses to YouTube
         mock_url_open_object = mock.Mock()
         mock_url_open_object.read.side_effect = [
@@ -86,3 +88,44 @@ def test_raises_recording_unavailable(missing_recording):
         mock_url_open.return_value = mock_url_open_object
         with pytest.raises(exceptions.RecordingUnavailable):
             YouTube('https://youtube.com/watch?v=5YceQ8YqYMc').streams
+
+
+def test_unknown_video_error_logs_single_record(caplog):
+    with caplog.at_level(logging.WARNING, logger='pytube.exceptions'):
+        exceptions.UnknownVideoError('hZpzr8TbF08', 'ERROR', 'reason', 'message')
+    assert len(caplog.records) == 1
+    assert 'hZpzr8TbF08' in caplog.records[0].getMessage()
+
+
+def test_error_string_is_cached():
+    e = exceptions.LoginRequired('hZpzr8TbF08', 'reason')
+    e.reason = 'other reason'
+    assert e.error_string == str(e)
+
+
+def test_video_unavailable_has_no_instance_dict():
+    e = exceptions.PoTokenRequired('hZpzr8TbF08', 'WEB')
+    assert e.error_string == str(e)
+    assert e.client_name == 'WEB'
+    assert not e.__dict__
+
+
+@pytest.mark.parametrize('error', [
+    exceptions.VideoPrivate('hZpzr8TbF08'),
+    exceptions.PoTokenRequired('hZpzr8TbF08', 'WEB'),
+    exceptions.LoginRequired('hZpzr8TbF08', 'reason'),
+    exceptions.UnknownVideoError('hZpzr8TbF08', 'ERROR', 'reason', 'message'),
+    exceptions.RegexMatchError('caller', 'pattern'),
+])
+def test_pickle_round_trip(error, caplog):
+    with caplog.at_level(logging.DEBUG):
+        unpickled = pickle.loads(pickle.dumps(error))
+    # __init__ isn't run again
+    assert not caplog.records
+    assert type(unpickled) is type(error)
+    assert str(unpickled) == str(error)
+    for slot in (
+        'video_id', 'client_name', 'reason', 'status', 'developer_message',
+        'caller', 'pattern', '_error_string'
+    ):
+        assert getattr(unpickled, slot, None) == getattr(error, slot, None)
@@ -1,14 +1,63 @@
+import gc
 import socket
+import threading
 import os
 import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest import mock
-from urllib.error import URLError
+from urllib import parse
+from urllib.error import HTTPError, URLError
 
 from pytube import request
-from pytube.exceptions import MaxRetriesExceeded
+from pytube.exceptions import MaxRetriesExceeded, RegexMatchError
+from pytube.helpers import make_fronted_url
 
 
-@mock.patch("pytube.request.urlopen")
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_HEAD(self):
+        # Segments are as long as their sequence number
+        query = parse.parse_qs(parse.urlsplit(self.path).query)
+        self.send_response(200)
+        self.send_header("Content-Length", query.get("sq", ["16384"])[0])
+        self.end_headers()
+
+    def do_GET(self):
+        if self.path.startswith("/missing"):
+            self.send_error(404)
+            return
+        if self.path.startswith("/redirect"):
+            self.send_response(302)
+            self.send_header("Location", self.path)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = b"Segment-Count: 40\r\n" if "sq=0" in self.path else b"body"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        self.server.ports.add(self.client_address[1])
+        self.server.request_lines.append(self.requestline)
+
+
+@pytest.fixture
+def local_server():
+    """Local HTTP/1.1 server, recording the client ports that connect to it."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    server.ports = set()
+    server.request_lines = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@mock.patch("pytube.request._urlopen")
 def test_streaming(mock_urlopen):
     # Given
     fake_stream_binary = [
@@ -28,7 +77,7 @@ def test_streaming(mock_urlopen):
     assert mock_response.read.call_count == 4
 
 
-@mock.patch('pytube.request.urlopen')
+@mock.patch('pytube.request._urlopen')
 def test_timeout(mock_urlopen):
     exc = URLError(reason=socket.timeout('timed_out'))
     mock_urlopen.side_effect = exc
@@ -37,7 +86,7 @@ def test_timeout(mock_urlopen):
         next(generator)
 
 
-@mock.patch("pytube.request.urlopen")
+@mock.patch("pytube.request._urlopen")
 def test_headers(mock_urlopen):
     response = mock.Mock()
     response.info.return_value = {"content-length": "16384"}
@@ -46,7 +95,7 @@ def test_headers(mock_urlopen):
     assert response == {"content-length": "16384"}
 
 
-@mock.patch("pytube.request.urlopen")
+@mock.patch("pytube.request._urlopen")
 def test_get(mock_urlopen):
     response = mock.Mock()
     response.read.return_value = "<html></html>".encode("utf-8")
@@ -58,3 +107,331 @@ def test_get(mock_urlopen):
 def test_get_non_http():
     with pytest.raises(ValueError):  # noqa: PT011
         request.get("file://bad")
+
+
+def test_released_connection_is_reused():
+    key = ("https", "fakeassurl.gov", "www.youtube.com", None)
+    conn, reused = request._acquire_connection(key)
+    assert not reused
+    request._release_connection(key, conn, reusable=True)
+    assert request._acquire_connection(key) == (conn, True)
+
+
+def test_unreusable_connection_is_closed():
+    key = ("https", "fakeassurl.gov", "www.youtube.com", None)
+    conn = mock.Mock()
+    request._release_connection(key, conn, reusable=False)
+    conn.close.assert_called_once()
+    assert request._acquire_connection(key)[0] is not conn
+
+
+def test_connections_are_not_shared_between_threads():
+    key = ("https", "fakeassurl.gov", "www.youtube.com", None)
+    conn, _ = request._acquire_connection(key)
+    request._release_connection(key, conn, reusable=True)
+
+    acquired = []
+    thread = threading.Thread(target=lambda: acquired.append(request._acquire_connection(key)))
+    thread.start()
+    thread.join()
+    assert acquired[0] == (mock.ANY, False)
+    assert acquired[0][0] is not conn
+
+
+@mock.patch("pytube.request.time.sleep")
+@mock.patch("pytube.request._urlopen")
+def test_get_retries_server_errors(mock_urlopen, mock_sleep):
+    response = mock.Mock()
+    response.read.return_value = b"<html></html>"
+    mock_urlopen.side_effect = [
+        HTTPError("", 503, "Service Unavailable", {}, None),
+        response,
+    ]
+    assert request.get("http://fakeassurl.gov") == "<html></html>"
+    assert mock_urlopen.call_count == 2
+    mock_sleep.assert_called_once()
+
+
+@mock.patch("pytube.request._urlopen")
+def test_post_is_not_retried(mock_urlopen):
+    mock_urlopen.side_effect = URLError(reason=socket.timeout("timed_out"))
+    with pytest.raises(URLError):
+        request.post("http://fakeassurl.gov")
+    assert mock_urlopen.call_count == 1
+
+
+@mock.patch("pytube.request.head")
+@mock.patch("pytube.request._execute_request")
+def test_seq_filesize(mock_execute_request, mock_head):
+    response = mock.Mock()
+    response.read.return_value = b"Raw_data\r\nSegment-Count: 3\r\n"
+    response.headers = {}
+    mock_execute_request.return_value = response
+    mock_head.return_value = {"content-length": "10"}
+    filesize = request.seq_filesize("http://fakeassurl.gov/seq_filesize?sq=0")
+    assert filesize == len(response.read.return_value) + 3 * 10
+
+
+@mock.patch("pytube.request.head")
+@mock.patch("pytube.request._execute_request")
+def test_seq_filesize_reads_partial_header(mock_execute_request, mock_head):
+    response = mock.Mock()
+    response.read.return_value = b"Raw_data\r\nSegment-Count: 3\r\n"
+    response.headers = {"Content-Range": "bytes 0-8191/50000"}
+    mock_execute_request.return_value = response
+    mock_head.return_value = {"content-length": "10"}
+    filesize = request.seq_filesize("http://fakeassurl.gov/seq_filesize_partial?sq=0")
+    assert filesize == 50000 + 3 * 10
+    assert mock_execute_request.call_count == 1
+    assert "Range" in mock_execute_request.call_args.kwargs["headers"]
+
+
+@mock.patch("pytube.request.head")
+@mock.patch("pytube.request._execute_request")
+def test_seq_filesize_unknown_header_size(mock_execute_request, mock_head):
+    partial_response = mock.Mock()
+    partial_response.read.return_value = b"Raw_data\r\nSegment-Count: 3\r\n"
+    partial_response.headers = {"Content-Range": "bytes 0-8191/*"}
+    full_response = mock.Mock()
+    full_response.read.return_value = b"Raw_data\r\nSegment-Count: 3\r\nMore_data"
+    mock_execute_request.side_effect = [partial_response, full_response]
+    mock_head.return_value = {"content-length": "10"}
+    filesize = request.seq_filesize("http://fakeassurl.gov/seq_filesize_unknown?sq=0")
+    # The size of the whole header is taken from the full response
+    assert filesize == len(full_response.read.return_value) + 3 * 10
+
+
+@mock.patch("pytube.request._execute_request")
+def test_seq_filesize_without_segment_count(mock_execute_request):
+    response = mock.Mock()
+    response.read.return_value = b"Raw_data"
+    response.headers = {"Content-Range": "bytes 0-7/8"}
+    mock_execute_request.return_value = response
+    with pytest.raises(RegexMatchError):
+        request.seq_filesize("http://fakeassurl.gov/seq_filesize_no_count?sq=0")
+    # The whole header is requested when the partial one has no segment count
+    assert mock_execute_request.call_count == 2
+
+
+@mock.patch("pytube.request.stream")
+def test_seq_stream(mock_stream):
+    mock_stream.side_effect = [
+        iter([b"Raw_data\r\nSegment-", b"Count: 2\r\n"]),
+        iter([b"a"]),
+        iter([b"b"]),
+    ]
+    chunks = list(request.seq_stream("http://fakeassurl.gov/seq_stream?sq=0"))
+    assert b"".join(chunks) == b"Raw_data\r\nSegment-Count: 2\r\nab"
+    assert mock_stream.call_count == 3
+
+
+@mock.patch("pytube.request.stream")
+def test_seq_stream_segment_count_split_across_chunks(mock_stream):
+    mock_stream.side_effect = [
+        iter([b"Raw_data\r\nSegment-Count: 1", b"2"]),
+        *[iter([b"a"]) for _ in range(12)],
+    ]
+    chunks = list(request.seq_stream("http://fakeassurl.gov/seq_stream?sq=0"))
+    assert len(chunks) == 2 + 12
+
+
+@mock.patch("pytube.request.stream")
+def test_seq_stream_without_segment_count(mock_stream):
+    mock_stream.return_value = iter([b"Raw_data"])
+    with pytest.raises(RegexMatchError):
+        list(request.seq_stream("http://fakeassurl.gov/seq_stream?sq=0"))
+
+
+@mock.patch("pytube.request._resolve_dns_ip")
+def test_get_dns_ip_is_cached_until_expiry(mock_resolve_dns_ip):
+    mock_resolve_dns_ip.side_effect = ["1.1.1.1", "2.2.2.2"]
+    with mock.patch("pytube.request.time.monotonic", return_value=1000):
+        assert request.get_dns_ip("fake.googlevideo.com") == "1.1.1.1"
+        assert request.get_dns_ip("fake.googlevideo.com") == "1.1.1.1"
+    expired = 1000 + request._dns_cache_ttl
+    with mock.patch("pytube.request.time.monotonic", return_value=expired):
+        assert request.get_dns_ip("fake.googlevideo.com") == "2.2.2.2"
+    assert mock_resolve_dns_ip.call_count == 2
+
+
+@mock.patch("pytube.request._execute_request")
+def test_streaming_resumes_short_response(mock_execute_request):
+    first = mock.Mock()
+    first.info.return_value = {"Content-Length": "6"}
+    first.read.side_effect = [b"abc", b""]
+    second = mock.Mock()
+    second.read.side_effect = [b"def", b""]
+    mock_execute_request.side_effect = [first, second]
+
+    assert b"".join(request.stream("http://fakeassurl.gov/resume_test?a=b")) == b"abcdef"
+    assert mock_execute_request.call_args_list[1].args[0] == (
+        "http://fakeassurl.gov/resume_test?a=b&range=3-5"
+    )
+
+
+@mock.patch("pytube.request._execute_request")
+def test_streaming_from_start_byte_pos(mock_execute_request):
+    response = mock.Mock()
+    response.info.return_value = {"Content-Length": "3"}
+    response.read.side_effect = [b"def", b""]
+    mock_execute_request.return_value = response
+
+    chunks = list(request.stream("http://fakeassurl.gov/start_test?a=b", start_byte_pos=3))
+    assert chunks == [b"def"]
+    assert mock_execute_request.call_count == 1
+
+
+def test_seq_url_prefix():
+    prefix = request._seq_url_prefix("https://fakeassurl.gov/videoplayback?a=1&sq=5&b=%2F")
+    assert prefix.endswith("/videoplayback?a=1&b=%2F&sq=")
+
+
+@mock.patch("pytube.request._urlopen")
+def test_last_url_only_kept_for_patched_hosts(mock_urlopen):
+    request._execute_request("https://rr1---sn-fake.googlevideo.com/videoplayback?a=b")
+    assert request._last_url.url == "https://rr1---sn-fake.googlevideo.com/videoplayback?a=b"
+    request._execute_request("https://www.youtube.com/watch?v=2lAe1cqCOXo")
+    assert request._last_url.url is None
+
+
+@mock.patch("pytube.request._orig_getaddrinfo")
+def test_patched_getaddrinfo_skips_lookup_for_resolver(mock_getaddrinfo):
+    request._last_url.url = "https://www.google.com/resolve?name=fake.googlevideo.com"
+    try:
+        addrinfo = socket.getaddrinfo("www.google.com", 443)
+    finally:
+        request._last_url.url = None
+    assert addrinfo[0][4] == (request._dns_resolver[1], 443)
+    mock_getaddrinfo.assert_not_called()
+
+
+def test_read_ip_from_dns_answer():
+    json_data = {
+        "Question": [{"name": "fake.googlevideo.com."}],
+        "Answer": [
+            {"name": "fake.googlevideo.com.", "data": "cname.googlevideo.com."},
+            {"name": "cname.googlevideo.com.", "data": "1.1.1.1"},
+            {"name": "cname.googlevideo.com.", "data": "2.2.2.2"},
+        ],
+    }
+    assert request._read_ip_from_dns_answer(json_data) == "1.1.1.1"
+
+
+def test_make_fronted_url_matches_helper():
+    for url in (
+        "https://rr1---sn-fake.googlevideo.com/videoplayback?a=b&range=0-99",
+        "https://rr1---sn-fake.googlevideo.com/videoplayback",
+        "https://www.youtube.com/watch?v=2lAe1cqCOXo",
+    ):
+        assert request._make_fronted_url(url) == make_fronted_url(url)
+
+
+def test_head_reuses_connection(local_server):
+    url = "http://127.0.0.1:%s/head_test" % local_server.server_address[1]
+    for _ in range(5):
+        assert request.head(url)["content-length"] == "16384"
+    request.get(url)
+    assert len(local_server.ports) == 1
+
+
+def test_responses_release_their_connection(local_server, monkeypatch):
+    monkeypatch.setattr(request, "read_chunk_size", 1)
+    url = "http://127.0.0.1:%s/release_test" % local_server.server_address[1]
+    gc.collect()
+    gc.disable()
+    try:
+        request.get(url)
+        request.head(url)
+        with pytest.raises(HTTPError):
+            request.get(url.replace("release_test", "missing"))
+        # Abandoned half way through the body
+        next(request.stream(url))
+        # Nothing is left for the cyclic garbage collector
+        assert not [
+            obj for obj in gc.get_objects()
+            if isinstance(obj, request._PooledResponse) and obj._release is not None
+        ]
+    finally:
+        gc.enable()
+
+
+def test_request_through_proxy(local_server, monkeypatch):
+    monkeypatch.setenv("http_proxy", "http://127.0.0.1:%s" % local_server.server_address[1])
+    monkeypatch.delenv("no_proxy", raising=False)
+    monkeypatch.delenv("NO_PROXY", raising=False)
+    url = "http://example.invalid/proxy_test"
+    assert request.get(url) == "body"
+    assert request.head(url)["content-length"] == "16384"
+    assert local_server.request_lines == [
+        "GET %s HTTP/1.1" % url,
+        "HEAD %s HTTP/1.1" % url,
+    ]
+    assert len(local_server.ports) == 1
+
+
+def test_too_many_redirects(local_server):
+    url = "http://127.0.0.1:%s/redirect" % local_server.server_address[1]
+    with pytest.raises(HTTPError) as exc_info:
+        request.get(url)
+    assert exc_info.value.code == 302
+
+
+def test_seq_filesize_sums_segments_across_workers(local_server):
+    url = "http://127.0.0.1:%s/seq_filesize_workers?a=b" % local_server.server_address[1]
+    filesize = request.seq_filesize(url)
+    assert filesize == len(b"Segment-Count: 40\r\n") + sum(range(1, 41))
+    request.seq_filesize(url.replace("a=b", "a=c"))
+    # Each worker reuses its connection for the segments it requests, across calls
+    assert len(local_server.ports) <= 1 + request._seq_filesize_workers
+
+
+@mock.patch("pytube.request.head")
+@mock.patch("pytube.request._execute_request")
+def test_seq_filesize_worker_error_propagates(mock_execute_request, mock_head):
+    response = mock.Mock()
+    response.read.return_value = b"Segment-Count: 40\r\n"
+    response.headers = {}
+    mock_execute_request.return_value = response
+
+    def fake_head(url):
+        if url.endswith("sq=17"):
+            raise HTTPError(url, 403, "Forbidden", {}, None)
+        return {"content-length": "10"}
+
+    mock_head.side_effect = fake_head
+    with pytest.raises(HTTPError):
+        request.seq_filesize("http://fakeassurl.gov/seq_filesize_worker_error?sq=0")
+
+
+@mock.patch("pytube.request.time.sleep")
+@mock.patch("pytube.request._urlopen")
+def test_retry_resolves_googlevideo_after_dns_lookup(mock_urlopen, mock_sleep):
+    url = "https://rr1---sn-fake.googlevideo.com/videoplayback?a=b"
+    last_urls = []
+
+    def fake_urlopen(req, timeout):
+        last_urls.append(request._last_url.url)
+        if len(last_urls) == 1:
+            # A cold DNS lookup made while connecting
+            request._last_url.url = "https://www.google.com/resolve?name=fake"
+            raise URLError(reason=socket.timeout("timed_out"))
+        return mock.Mock()
+
+    mock_urlopen.side_effect = fake_urlopen
+    request._execute_request(url, method="GET", retries=1)
+    assert last_urls == [url, url]
+
+
+@mock.patch("pytube.request._urlopen")
+def test_dns_lookup_restores_last_url(mock_urlopen):
+    response = mock.Mock()
+    response.read.return_value = (
+        b'{"Question": [{"name": "fake."}], "Answer": [{"name": "fake.", "data": "1.1.1.1"}]}'
+    )
+    mock_urlopen.return_value = response
+    request._last_url.url = "https://rr1---sn-fake.googlevideo.com/videoplayback"
+    try:
+        assert request._resolve_dns_ip("fake") == "1.1.1.1"
+        assert request._last_url.url == "https://rr1---sn-fake.googlevideo.com/videoplayback"
+    finally:
+        request._last_url.url = None
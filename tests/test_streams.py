@@ -312,7 +312,7 @@ def test_repr_for_adaptive_streams(cipher_signature):
 def test_segmented_stream_on_404(cipher_signature):
     stream = cipher_signature.streams.filter(adaptive=True)[0]
     with mock.patch('pytube.request.head') as mock_head:
-        with mock.patch('pytube.request.urlopen') as mock_url_open:
+        with mock.patch('pytube.request._urlopen') as mock_url_open:
             # Mock the responses to YouTube
             mock_url_open_object = mock.Mock()
 